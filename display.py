@@ -125,3 +125,51 @@ def display(countdown_time, origin, destination):
     # If countdown_time more than one character long:
     if is_one(countdown_time) is False:
         return(fill_line(countdown_time+' mins')+fill_line(origin)+fill_line(destination))
+
+
+class TerminalLcd(object):
+
+    '''
+    Stands in for dothat.lcd when running without a Display-O-Tron HAT.
+
+    Keeps the characters written since the last clear and mocks-up the screen
+    in the terminal using mock_up, so the whole pipeline can run headless.
+
+    Example:
+
+        lcd = TerminalLcd()
+        lcd.write(display('2', 'Bristol', 'Bath'))
+
+        Prints:
+            2 mins
+            Bristol
+            Bath
+    '''
+
+    def __init__(self):
+        # Start with an empty screen
+        self.screen = ''
+
+    def set_contrast(self, contrast):
+        # A terminal has no contrast to set
+        pass
+
+    def clear(self):
+        # Empty the screen
+        self.screen = ''
+
+    def write(self, input_string):
+        # Add input_string to the screen, keeping to the 48 characters available
+        self.screen = (self.screen + str(input_string))[:48]
+
+        # Mock-up the screen in the terminal, padding each line to 16 characters
+        mock_up(fill_line(self.screen[:16]) + fill_line(self.screen[16:32]) + fill_line(self.screen[32:48]))
+
+
+class TerminalBacklight(object):
+
+    '''Stands in for dothat.backlight when running without a Display-O-Tron HAT.'''
+
+    def rgb(self, red, green, blue):
+        # A terminal has no backlight to colour
+        pass
@@ -6,48 +6,218 @@ About:
 
     Uses Realtime trains
 
+    Run with --headless to mock-up the screen in the terminal instead of using a Display-o-tron HAT,
+    --idle to only wake up when the countdown changes or new data is due, and --report to print the
+    CPU time per fetch, and wakeups, fetches, bytes fetched and redraws per hour after each fetch.
+
 # Development
     First developed by Dale Potter and Henry Morris in Madrid from 8th to 12th December 2017
 
 '''
 
 # Import libraries
+import argparse
+import math
+import sys
 import requests
 import display
 import rtt
-from dothat import lcd, backlight
+import usage
+from datetime import datetime, timedelta
 from time import sleep
 
+# The longest --refresh accepted, in seconds: one day
+MAX_REFRESH_SECS = 24 * 60 * 60
+
+
+def positive_number(input_string):
+
+    '''Returns input_string as a float, raising argparse.ArgumentTypeError unless it is above zero and at most MAX_REFRESH_SECS.'''
+
+    try:
+        number = float(input_string)
+    except ValueError:
+        raise argparse.ArgumentTypeError('{} is not a number'.format(input_string))
+
+    if math.isfinite(number) is False or number <= 0:
+        raise argparse.ArgumentTypeError('{} is not above zero'.format(input_string))
+
+    if number > MAX_REFRESH_SECS:
+        raise argparse.ArgumentTypeError('{} is more than {} seconds'.format(input_string, MAX_REFRESH_SECS))
+
+    return number
+
+
+def parse_args(argv=None):
+
+    '''Returns the command line options for the board.'''
+
+    parser = argparse.ArgumentParser(description='Realtime train information board')
+    parser.add_argument('--headless', action='store_true',
+                        help='mock-up the screen in the terminal instead of using a Display-o-tron HAT')
+    parser.add_argument('--idle', action='store_true',
+                        help='only wake up when the countdown changes or new data is due')
+    parser.add_argument('--refresh', type=positive_number, default=5,
+                        help='seconds between fetching data from Realtime Trains (default: 5)')
+    parser.add_argument('--report', action='store_true',
+                        help='print CPU time per fetch, and wakeups, fetches, bytes fetched and redraws per hour, '
+                             'after each fetch')
+    return parser.parse_args(argv)
+
+
+def load_screen(headless):
+
+    '''Returns the lcd and backlight to draw on, only importing dothat when a Display-o-tron HAT is used.'''
+
+    # If running without a Display-o-tron HAT
+    if headless is True:
+        # Return stand-ins which mock-up the screen in the terminal
+        return display.TerminalLcd(), display.TerminalBacklight()
+
+    from dothat import lcd, backlight
+    return lcd, backlight
+
+
+def fetch_trains(report):
+
+    '''Returns trains from Realtime Trains, recording the bytes fetched on report.'''
+
+    url = rtt.generate_rtt_url()
+    data = requests.get(url)
+    report.fetched(len(data.content))
+    return rtt.load_rtt_trains(data.text)
+
+
+def write_screen(lcd, report, input_string):
+
+    '''Replaces what is on lcd with input_string, recording the redraw on report.'''
+
+    lcd.clear()
+    lcd.write(input_string)
+    report.redraw()
+
+
+def show_train(lcd, report, train):
+
+    '''Writes train's countdown, origin and destination to lcd, recording the redraw on report.'''
+
+    expected_mins = rtt.mins_left_calc(train['datetime_actual'])
+
+    display_str = display.display(str(expected_mins), train['origin'], train['destination'])
+    write_screen(lcd, report, display_str)
+
+
+def next_wakeup(now, next_fetch, event_time):
+
+    '''
+    Returns how long idle mode should sleep, and whether to redraw the countdown on waking.
+
+    Args:
+        now (datetime): The current time.
+        next_fetch (datetime): The time that the next fetch from Realtime Trains is due.
+        event_time (datetime): The time of the train being counted down to.
+
+    Returns:
+        (tuple) Seconds to sleep as a float, and True if the countdown should be redrawn on waking,
+        or False if the next fetch will be due instead.
+
+    Illustrative example:
+
+        Args:
+            now: Time now as datetime
+            next_fetch: Time in two minutes as datetime
+            event_time: Time in exactly two minutes and thirty seconds as datetime
+
+        Returns:
+            (31.0, True)
+    '''
+
+    # Save seconds until the next fetch is due
+    until_fetch = (next_fetch - now).total_seconds()
+
+    # If the next fetch is already due, fetch without sleeping
+    if until_fetch <= 0:
+        return 0, False
+
+    # Save seconds until the countdown changes, capped at the next fetch
+    wait = rtt.secs_to_next_change(event_time, now, max_wait=until_fetch)
+
+    # If the countdown will not change again, sleep until the next fetch
+    if wait == 0:
+        return until_fetch, False
+
+    # Only redraw if the countdown changes before the next fetch, as fetching redraws the screen anyway
+    return wait, wait < until_fetch
+
+
+def run(options, report=None):
+
+    '''
+    Runs the board until interrupted.
+
+    Args:
+        options (argparse.Namespace): The command line options from parse_args.
+        report (UsageReport): The report to record usage on. Defaults to None, which is later set as a new report.
+    '''
+
+    if report is None:
+        report = usage.UsageReport()
+
+    lcd, backlight = load_screen(options.headless)
+
+    try:
+        # Turn Display-o-tron backlight on and make it white
+        backlight.rgb(255, 255, 255)
+
+        # Set Display-o-tron contrast to be as sharp as possible
+        lcd.set_contrast(50)
+
+        # Display 'Connecting...' message on Display-o-tron
+        write_screen(lcd, report, 'Connecting...')
+
+        # While connection to Realtime Trains does not work
+        while rtt.test_rtt_connection() is False:
+            # Display "Cannot connect" message on Display-o-tron
+            write_screen(lcd, report, 'Trying to connect...')
+            # Wait for two seconds
+            sleep(2)
+            report.wakeup()
+
+        while True:
+            # Idle mode skips the 'Refreshing...' message to save writing to the screen twice
+            if options.idle is False:
+                write_screen(lcd, report, 'Refreshing...')
+
+            trains = fetch_trains(report)
+            next_fetch = datetime.now() + timedelta(seconds=options.refresh)
+
+            show_train(lcd, report, trains[0])
+            if options.report is True:
+                print(report.format(), file=sys.stderr)
+
+            # Without idle mode, wait for the next fetch
+            if options.idle is False:
+                sleep(options.refresh)
+                report.wakeup()
+                continue
+
+            # In idle mode, sleep until the countdown changes, redrawing it, until the next fetch is due
+            while True:
+                wait, redraw = next_wakeup(datetime.now(), next_fetch, trains[0]['datetime_actual'])
+
+                if wait > 0:
+                    sleep(wait)
+                    report.wakeup()
+
+                if redraw is False:
+                    break
+
+                show_train(lcd, report, trains[0])
+
+    except KeyboardInterrupt:
+        if options.report is True:
+            print(report.format(), file=sys.stderr)
+
+
 if __name__ == "__main__":
-    # Turn Display-o-tron backlight on and make it white
-    backlight.rgb(255, 255, 255)
-
-    # Set Display-o-tron contrast to be as sharp as possible
-    lcd.set_contrast(50)
-
-    # Display 'Connecting...' message on Display-o-tron
-    lcd.write('Connecting...')
-
-    # While connection to Realtime Trains does not work
-    while rtt.test_rtt_connection() is False:
-        # Clear Display-o-tron display
-        lcd.clear()
-        # Display "Cannot connect" message on Display-o-tron
-        lcd.write('Trying to connect...')
-        # Wait for two seconds
-        sleep(2)
-
-    while True:
-        lcd.clear()
-        lcd.write("Refreshing...")
-
-        url = rtt.generate_rtt_url()
-        data = requests.get(url)
-        trains = rtt.load_rtt_trains(data.text)
-        expected_mins = rtt.mins_left_calc(trains[0]['datetime_actual'])
-
-        lcd.clear()
-        display_str = display.display(str(expected_mins), trains[0]['origin'], trains[0]['destination'])
-        lcd.write(display_str)
-
-        sleep(5)  # Wait for a number of seconds minute
+    run(parse_args())
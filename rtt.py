@@ -200,3 +200,45 @@ def convert_time(time_string, time_accessed):
         converted_time = converted_time + timedelta(days=1)
 
     return converted_time
+
+
+def secs_to_next_change(event_time, comparison_time=None, max_wait=60):
+
+    '''
+    Returns number of seconds from comparison_time until the countdown for event_time should next be redrawn.
+
+    Args:
+        event_time (datetime): The time of the event.
+        comparison_time (datetime): The time to count from. Defaults to None, which is latar set as the current time.
+        max_wait (number): The most seconds to return. Defaults to 60.
+
+    Returns:
+        (Float) Number of seconds to sleep before mins_left_calc next gives a different result for event_time,
+        or 0.0 once event_time is under a minute away. From then on the countdown is deliberately held at 0 mins
+        until the next fetch, rather than counting on to -1 mins, -2 mins and so on while the train is late.
+
+    Illustrative example:
+
+        Args:
+            event_time: Time in exactly two minutes and thirty seconds as datetime
+            comparison_time: Time now as datetime
+
+        Returns:
+            31.0
+    '''
+    # Set the comparison_time to the current time if no input is received.
+    if comparison_time is None:
+        comparison_time = datetime.now()
+
+    # Save seconds remaining until event_time
+    remaining = (event_time - comparison_time).total_seconds()
+
+    # Under a minute away, hold the countdown at 0 mins until the next fetch instead of counting on while the train is late
+    if remaining < 60:
+        return 0.0
+
+    # The countdown drops a minute once remaining passes below a whole minute, so wait until just after then
+    wait = (remaining % 60) + 1
+
+    # Never wait longer than max_wait
+    return float(min(wait, max_wait))
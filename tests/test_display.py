@@ -38,3 +38,19 @@ def test_display():
     assert 'min' in (display.display('1', 'Short name', 'Short name'))
     assert 'mins' in (display.display('2', 'Short name', 'Short name'))
     assert 'mins' in (display.display('20', 'Short name', 'Short name'))
+
+
+def test_terminal_lcd(capsys):
+
+    '''Tests that the terminal stand-in for the Display-O-Tron mocks-up what is written to it.'''
+
+    lcd = display.TerminalLcd()
+    lcd.write(display.display('2', 'Bristol', 'Bath'))
+
+    # Test screen is printed as three 16 character lines
+    assert capsys.readouterr().out == '2 mins          \nBristol         \nBath            \n'
+
+    # Test clearing empties the screen
+    lcd.clear()
+    lcd.write('Refreshing...')
+    assert lcd.screen == 'Refreshing...'
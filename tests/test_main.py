@@ -0,0 +1,139 @@
+import display
+import main
+import pytest
+import rtt
+import sys
+import usage
+from datetime import datetime, timedelta
+from freezegun import freeze_time
+
+
+class FakeLcd(object):
+    """Records each screen written, in place of dothat.lcd."""
+
+    def __init__(self):
+        self.screens = []
+
+    def set_contrast(self, contrast):
+        pass
+
+    def clear(self):
+        pass
+
+    def write(self, input_string):
+        self.screens.append(input_string)
+
+
+def train_screen(countdown_time):
+    """Return the screen written for the train used by run_board when countdown_time (str) minutes away."""
+    return display.display(countdown_time, 'Bristol', 'Bath')
+
+
+def run_board(monkeypatch, argv, connections, sleeps_until_interrupt):
+    """Run the board with a fake screen, fetch and sleep, interrupting it on the given sleep.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture.
+        argv (list of str): The command line options to run with.
+        connections (list of bool): The results of each connection test, in order.
+        sleeps_until_interrupt (int): The sleep to raise KeyboardInterrupt on.
+
+    Returns:
+        tuple: The seconds slept (list of float), each screen written (list of str) and the UsageReport.
+    """
+    start_time = datetime(2017, 12, 10, 22, 34, 0)
+    train = {'origin': 'Bristol', 'destination': 'Bath',
+             'datetime_actual': start_time + timedelta(minutes=4, seconds=30)}
+    lcd = FakeLcd()
+    sleeps = []
+    report = usage.UsageReport()
+
+    def fake_fetch_trains(report):
+        report.fetched(100)
+        return [train]
+
+    monkeypatch.setattr(main, 'load_screen', lambda headless: (lcd, display.TerminalBacklight()))
+    monkeypatch.setattr(main, 'fetch_trains', fake_fetch_trains)
+    monkeypatch.setattr(rtt, 'test_rtt_connection', lambda: connections.pop(0))
+
+    with freeze_time(start_time) as frozen_time:
+        def fake_sleep(secs):
+            sleeps.append(secs)
+            if len(sleeps) == sleeps_until_interrupt:
+                raise KeyboardInterrupt
+            frozen_time.tick(timedelta(seconds=secs))
+
+        monkeypatch.setattr(main, 'sleep', fake_sleep)
+        main.run(main.parse_args(argv), report)
+
+    return sleeps, lcd.screens, report
+
+
+@pytest.mark.parametrize("refresh", ['-1', '0', 'nan', 'inf', '86401', '1e12', 'soon'])
+def test_parse_args_rejects_bad_refresh(refresh):
+    """Test that --refresh only accepts a number of seconds above zero and no more than a day."""
+    with pytest.raises(SystemExit):
+        main.parse_args(['--refresh', refresh])
+
+
+def test_parse_args_refresh():
+    """Test that --refresh is read as seconds and defaults to 5."""
+    assert main.parse_args(['--refresh', '120']).refresh == 120
+    assert main.parse_args([]).refresh == 5
+    assert main.parse_args(['--refresh', '86400']).refresh == main.MAX_REFRESH_SECS
+
+
+def test_next_wakeup():
+    """Test that idle mode sleeps until the countdown changes or the next fetch is due, whichever comes first."""
+    now = datetime(2017, 12, 10, 22, 34, 0)
+    next_fetch = datetime(2017, 12, 10, 22, 36, 0)
+
+    # Test countdown changing before the next fetch is redrawn on waking
+    assert main.next_wakeup(now, next_fetch, datetime(2017, 12, 10, 22, 36, 30)) == (31, True)
+
+    # Test countdown changing after the next fetch sleeps until the fetch without redrawing
+    assert main.next_wakeup(now, datetime(2017, 12, 10, 22, 34, 20), datetime(2017, 12, 10, 22, 36, 30)) == (20, False)
+
+    # Test train under a minute away sleeps until the next fetch without redrawing
+    assert main.next_wakeup(now, next_fetch, datetime(2017, 12, 10, 22, 34, 30)) == (120, False)
+
+    # Test train that has passed sleeps until the next fetch without redrawing
+    assert main.next_wakeup(now, next_fetch, datetime(2017, 12, 10, 22, 30, 0)) == (120, False)
+
+    # Test fetch already due does not sleep
+    assert main.next_wakeup(now, datetime(2017, 12, 10, 22, 33, 0), datetime(2017, 12, 10, 22, 36, 30)) == (0, False)
+
+
+def test_run(monkeypatch):
+    """Test that without idle mode the board fetches and redraws every refresh, counting every screen written."""
+    sleeps, screens, report = run_board(monkeypatch, ['--refresh', '5'], [False, True], sleeps_until_interrupt=3)
+
+    assert sleeps == [2, 5, 5]  # Retry connecting, then wait a refresh after each fetch
+    assert screens == ['Connecting...', 'Trying to connect...',
+                       'Refreshing...', train_screen('4'), 'Refreshing...', train_screen('4')]
+    assert report.wakeups == 2  # Interrupted during the third sleep
+    assert report.fetches == 2
+    assert report.redraws == 6
+
+
+def test_run_idle(monkeypatch):
+    """Test that idle mode redraws only when the countdown changes and goes back to fetching when one is due."""
+    sleeps, screens, report = run_board(monkeypatch, ['--idle', '--refresh', '120'], [True], sleeps_until_interrupt=6)
+
+    # Train 4.5 minutes away, fetching every 2 minutes, with the countdown held at 0 mins under a minute away
+    assert sleeps == [31, 60, 29, 31, 60, 29]
+    assert screens == ['Connecting...', train_screen('4'), train_screen('3'), train_screen('2'),
+                       train_screen('2'), train_screen('1'), train_screen('0')]
+    assert report.wakeups == 5  # Interrupted during the sixth sleep
+    assert report.fetches == 2
+    assert report.redraws == 7
+
+
+def test_load_screen_headless(monkeypatch):
+    """Test that headless mode draws on the terminal stand-ins without importing dothat."""
+    monkeypatch.setitem(sys.modules, 'dothat', None)  # Importing dothat now raises ImportError
+
+    lcd, backlight = main.load_screen(True)
+
+    assert isinstance(lcd, display.TerminalLcd)
+    assert isinstance(backlight, display.TerminalBacklight)
@@ -248,3 +248,46 @@ def test_convert_time():
 
     # Test late evening time with quarter minute and event due the next day
     assert rtt.convert_time('0010¼', datetime(2017, 12, 12, 23, 0, 0, 0)) == datetime(2017, 12, 13, 0, 10, 15, 0)
+
+
+def test_secs_to_next_change():
+
+    '''Tests that the wait lasts until just after the countdown changes, and never longer than max_wait'''
+
+    comparison_time = datetime(2017, 12, 10, 22, 34, 0)
+
+    # Test event two and a half minutes away changes countdown in thirty seconds
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 36, 30), comparison_time) == 31
+
+    # Test event exactly two minutes away changes countdown straight away
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 36, 0), comparison_time) == 1
+
+    # Test wait is capped at max_wait
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 36, 50), comparison_time, max_wait=20) == 20
+
+    # Test event under a minute away needs no wait, as the countdown stays at 0 mins
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 34, 30), comparison_time) == 0
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 34, 59), comparison_time) == 0
+
+    # Test event exactly one minute away changes countdown to 0 mins straight away
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 35, 0), comparison_time) == 1
+
+    # Test event in the past needs no wait
+    assert rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 33, 0), comparison_time) == 0
+
+    # Test seconds are always returned as a float
+    assert isinstance(rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 33, 0), comparison_time), float)
+    assert isinstance(rtt.secs_to_next_change(datetime(2017, 12, 10, 22, 36, 50), comparison_time, max_wait=20), float)
+
+
+def test_secs_to_next_change_default():
+    """Test that the current datetime is used when secs_to_next_change does not receive a comparison_time parameter."""
+    mock_datetime = datetime(year=2000, month=1, day=1,
+                             hour=0, minute=0, second=0)
+
+    with freeze_time(mock_datetime):
+        event_time = datetime(year=2000, month=1, day=1,
+                              hour=0, minute=10, second=15)
+        result = rtt.secs_to_next_change(event_time=event_time)
+
+    assert result == 16
@@ -0,0 +1,81 @@
+import usage
+import pytest
+
+
+class FakeClock(object):
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_usage_report_summary():
+    """Test that counts are reported per hour and CPU time per fetch, not per redraw."""
+    clock = FakeClock()
+    cpu_clock = FakeClock()
+    children_cpu_clock = FakeClock()
+    report = usage.UsageReport(clock=clock, cpu_clock=cpu_clock, children_cpu_clock=children_cpu_clock)
+
+    report.wakeup()
+    report.wakeup()
+    report.redraw()
+    report.redraw()
+    report.redraw()
+    report.fetched(600)
+    report.fetched(400)
+    clock.now = 1800  # Half an hour
+    cpu_clock.now = 2
+    children_cpu_clock.now = 1  # e.g. ping
+
+    result = report.summary()
+
+    assert result['secs'] == 1800
+    assert result['cpu_secs'] == 3
+    assert result['children_cpu_secs'] == 1
+    assert result['cpu_secs_per_fetch'] == 1.5
+    assert result['fetches'] == 2
+    assert result['bytes_fetched'] == 1000
+    assert result['redraws'] == 3
+    assert result['cpu_secs_per_hour'] == 6
+    assert result['wakeups_per_hour'] == 4
+    assert result['fetches_per_hour'] == 4
+    assert result['bytes_fetched_per_hour'] == 2000
+    assert result['redraws_per_hour'] == 6
+    assert 'per hour: 6.00 CPU s, 4 wakeups, 4 fetches, 2000 bytes fetched, 6 redraws' in report.format()
+
+
+def test_usage_report_empty():
+    """Test that a report with no time elapsed or fetches does not divide by zero."""
+    report = usage.UsageReport(clock=FakeClock(), cpu_clock=FakeClock(), children_cpu_clock=FakeClock())
+
+    result = report.summary()
+
+    assert result['cpu_secs_per_fetch'] == 0
+    assert result['wakeups_per_hour'] is None
+
+
+def test_usage_report_holds_back_rates():
+    """Test that rates per hour are only given once min_secs have passed, with totals given until then."""
+    clock = FakeClock()
+    report = usage.UsageReport(clock=clock, cpu_clock=FakeClock(), children_cpu_clock=FakeClock(), min_secs=60)
+    report.fetched(100)
+    clock.now = 5
+
+    assert report.summary()['fetches_per_hour'] is None
+    assert report.format() == '5 s: 0.00 CPU s (0.00 in child processes), 0.0000 CPU s/fetch, 0 wakeups, 1 fetches, 100 bytes fetched, 0 redraws; per hour: n/a'
+
+    clock.now = 60
+    assert report.summary()['fetches_per_hour'] == 60
+
+
+@pytest.mark.parametrize("secs, expected", [
+    (12, '12 s'),
+    (90, '1.5 min'),
+    (5400, '1.50 h'),
+ ])
+def test_format_duration(secs, expected):
+    """Test that durations are given in seconds, minutes or hours."""
+    assert usage.format_duration(secs) == expected
@@ -0,0 +1,107 @@
+from os import times
+from time import monotonic, process_time
+
+
+def children_process_time():
+    """Return CPU time used by finished child processes, such as the ping run by rtt.test_rtt_connection, in seconds."""
+    child_times = times()
+    return child_times.children_user + child_times.children_system
+
+
+def format_duration(secs):
+    """Return secs (number) as text in seconds, minutes or hours, whichever reads best."""
+    if secs < 60:
+        return '{:.0f} s'.format(secs)
+    if secs < 60 * 60:
+        return '{:.1f} min'.format(secs / 60)
+    return '{:.2f} h'.format(secs / (60 * 60))
+
+
+class UsageReport(object):
+    """Counts the CPU time, wakeups and bytes fetched by the board so configurations can be compared.
+
+    Energy is not measured, as a Pi has no way to report it. CPU time, wakeups and bytes fetched are given
+    as stand-ins, since each one costs energy. CPU time covers the board and its finished child processes,
+    but not work done for it elsewhere, such as by the kernel's network stack or the Display-o-tron.
+
+    Args:
+        clock (callable): Returns elapsed wall time in seconds. Defaults to time.monotonic.
+        cpu_clock (callable): Returns CPU time used by the process in seconds. Defaults to time.process_time.
+        children_cpu_clock (callable): Returns CPU time used by finished child processes in seconds.
+            Defaults to children_process_time.
+        min_secs (number): Seconds that must pass before rates per hour are given, as scaling up the first few
+            seconds gives misleading rates. Defaults to 60.
+    """
+
+    def __init__(self, clock=monotonic, cpu_clock=process_time, children_cpu_clock=children_process_time, min_secs=60):
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+        self.children_cpu_clock = children_cpu_clock
+        self.min_secs = min_secs
+        self.started = clock()
+        self.cpu_started = cpu_clock()
+        self.children_cpu_started = children_cpu_clock()
+        self.wakeups = 0
+        self.fetches = 0
+        self.redraws = 0
+        self.bytes_fetched = 0
+
+    def wakeup(self):
+        """Record the board waking up from a sleep."""
+        self.wakeups += 1
+
+    def redraw(self):
+        """Record the screen being redrawn."""
+        self.redraws += 1
+
+    def fetched(self, num_bytes):
+        """Record a fetch of num_bytes (int) from Realtime Trains."""
+        self.fetches += 1
+        self.bytes_fetched += num_bytes
+
+    def summary(self):
+        """Return usage since the report was created.
+
+        Returns:
+            dict: Containing 'secs' elapsed, 'cpu_secs' used including 'children_cpu_secs', 'cpu_secs_per_fetch',
+            totals of 'wakeups', 'fetches', 'bytes_fetched' and 'redraws', and 'cpu_secs' and each total per hour
+            (keys ending '_per_hour').
+            Rates per hour are None until min_secs have passed.
+        """
+        secs = self.clock() - self.started
+        children_cpu_secs = self.children_cpu_clock() - self.children_cpu_started
+        cpu_secs = self.cpu_clock() - self.cpu_started + children_cpu_secs
+
+        def per_hour(value):
+            return value * 60 * 60 / secs if secs >= self.min_secs and secs > 0 else None
+
+        return {
+            'secs': secs,
+            'cpu_secs': cpu_secs,
+            'children_cpu_secs': children_cpu_secs,
+            'cpu_secs_per_fetch': cpu_secs / self.fetches if self.fetches else 0.0,
+            'wakeups': self.wakeups,
+            'fetches': self.fetches,
+            'bytes_fetched': self.bytes_fetched,
+            'redraws': self.redraws,
+            'cpu_secs_per_hour': per_hour(cpu_secs),
+            'wakeups_per_hour': per_hour(self.wakeups),
+            'fetches_per_hour': per_hour(self.fetches),
+            'bytes_fetched_per_hour': per_hour(self.bytes_fetched),
+            'redraws_per_hour': per_hour(self.redraws),
+        }
+
+    def format(self):
+        """Return the summary as a single line of text, giving rates per hour as n/a until min_secs have passed."""
+        summary = self.summary()
+
+        line = ('{elapsed}: {cpu_secs:.2f} CPU s ({children_cpu_secs:.2f} in child processes), '
+                '{cpu_secs_per_fetch:.4f} CPU s/fetch, {wakeups} wakeups, {fetches} fetches, {bytes_fetched} bytes fetched, {redraws} redraws').format(
+                    elapsed=format_duration(summary['secs']), **summary)
+
+        if summary['wakeups_per_hour'] is None:
+            return line + '; per hour: n/a'
+
+        return line + ('; per hour: {cpu_secs_per_hour:.2f} CPU s, {wakeups_per_hour:.0f} wakeups, '
+                       '{fetches_per_hour:.0f} fetches, {bytes_fetched_per_hour:.0f} bytes fetched, '
+                       '{redraws_per_hour:.0f} redraws').format(**summary)